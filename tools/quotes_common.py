@@ -0,0 +1,161 @@
+"""
+Shared driver for the smartquotes and straightquotes tools.
+
+Finds the prose in a Markdown document, skipping code blocks (``` ... ```),
+inline code (` ... `) and YAML front matter (--- ... ---), and runs a
+tool's converter over each stretch of prose. Also provides the
+command-line entry point both tools share.
+"""
+
+import sys
+import re
+from pathlib import Path
+from typing import Callable
+
+# Inline code, which never spans lines
+_INLINE_CODE_RE = re.compile(r'`[^`\n]+`')
+
+# Front matter and fenced code blocks, matched a whole block at a time. Both
+# are anchored to line starts; the fence pattern leads with its literal
+# so the scan can jump straight to candidate backticks.
+_FRONT_MATTER_RE = re.compile(r'---$(?:\n(?!---$)[^\n]*)*(?:\n---$\n?|\Z)', re.M)
+_FENCE_RE = re.compile(r'```(?<=^```)[^\n]*(?:\n(?!```)[^\n]*)*(?:\n```[^\n]*\n?|\Z)', re.M)
+
+
+def split_and_convert(text: str, converter: Callable[[str], str]) -> str:
+    """Apply converter to each prose span of text, preserving code sections."""
+    # Unchanged stretches are copied from the input as single slices; only
+    # prose spans that convert to something different are emitted
+    result = []
+    copied = 0
+
+    for start, end in iter_prose_spans(text):
+        span = text[start:end]
+        converted = converter(span)
+        if converted != span:
+            result.append(text[copied:start])
+            result.append(converted)
+            copied = end
+
+    if not result:
+        return text
+    result.append(text[copied:])
+    return ''.join(result)
+
+
+def needs_conversion(text: str, converter: Callable[[str], str]) -> bool:
+    """Check whether split_and_convert would change text.
+
+    Stops at the first prose span that would change, without building the
+    converted document.
+    """
+    for start, end in iter_prose_spans(text):
+        span = text[start:end]
+        if converter(span) != span:
+            return True
+    return False
+
+
+def iter_prose_spans(text: str):
+    """Yield (start, end) offsets of prose, skipping code and front matter.
+
+    Each region between code blocks is a single span, only broken around
+    inline code. Spans may hold any number of lines.
+    """
+    for start, end in iter_prose_regions(text):
+        for code in _INLINE_CODE_RE.finditer(text, start, end):
+            if start < code.start():
+                yield start, code.start()
+            start = code.end()
+        if start < end:
+            yield start, end
+
+
+def iter_prose_regions(text: str):
+    """Yield (start, end) offsets of the text outside front matter and code blocks."""
+    start = 0
+    # YAML front matter (only at start of file)
+    front_matter = _FRONT_MATTER_RE.match(text)
+    if front_matter:
+        start = front_matter.end()
+
+    for block in _FENCE_RE.finditer(text, start):
+        yield start, block.start()
+        start = block.end()
+    yield start, len(text)
+
+
+def run(usage: str, converter: Callable[[str], str], trigger_bytes: tuple) -> None:
+    """Command-line entry point shared by both tools.
+
+    converter is applied to each prose span. trigger_bytes lists the UTF-8
+    byte strings a file must contain for converter to change anything; files
+    without any of them are still decoded, so invalid UTF-8 is reported, but
+    never converted. An empty tuple converts every file.
+    """
+    if len(sys.argv) < 2:
+        print(usage)
+        sys.exit(1)
+
+    # Parse arguments
+    check_mode = False
+    inplace = False
+    file_args = []
+    for arg in sys.argv[1:]:
+        if arg == '--check':
+            check_mode = True
+        elif arg == '--inplace':
+            inplace = True
+        elif not arg.startswith('--'):
+            # Get file path (skip unknown flags)
+            file_args.append(arg)
+
+    if not file_args:
+        print("Error: No file specified", file=sys.stderr)
+        sys.exit(1)
+
+    # Handle stdin explicitly, rejecting --inplace before reading anything
+    is_stdin = file_args[0] in ('-', '/dev/stdin')
+    if is_stdin and inplace:
+        print("Error: Cannot use --inplace with stdin", file=sys.stderr)
+        sys.exit(1)
+
+    if is_stdin:
+        filepath = None
+        name = '<stdin>'
+        original = sys.stdin.read()
+        may_convert = True
+    else:
+        filepath = Path(file_args[0])
+        name = filepath
+        if not filepath.exists():
+            print(f"Error: File not found: {filepath}", file=sys.stderr)
+            sys.exit(1)
+
+        # One read and one decode; read_text would go through TextIOWrapper
+        raw = filepath.read_bytes()
+        may_convert = not trigger_bytes or any(needle in raw for needle in trigger_bytes)
+        try:
+            original = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            print(f"Error: Not valid UTF-8: {filepath}", file=sys.stderr)
+            sys.exit(1)
+        if '\r' in original:
+            # Keep read_text's universal newlines: \r\n and \r become \n
+            original = original.replace('\r\n', '\n').replace('\r', '\n')
+
+    if check_mode:
+        if may_convert and needs_conversion(original, converter):
+            print(f"{name}: needs conversion")
+            sys.exit(1)
+        else:
+            print(f"{name}: ok")
+            sys.exit(0)
+
+    converted = split_and_convert(original, converter) if may_convert else original
+
+    if inplace:
+        filepath.write_bytes(converted.encode('utf-8'))
+        print(f"Converted: {filepath}")
+    else:
+        print(converted)
@@ -13,136 +13,77 @@ Usage:
     smartquotes <file>           # Print converted output to stdout
     smartquotes <file> --inplace # Modify file in place
     smartquotes --check <file>   # Check if file needs conversion (exit 1 if yes)
+
+Needs quotes_common.py from the same directory; copy or symlink both files
+together. A symlinked script still finds it next to the real file.
 """
 
 import sys
 import re
 from pathlib import Path
 
+# Resolve the shared module next to this file, wherever the script is
+# imported or run from
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import quotes_common
+
+# Unicode characters
+LEFT_DOUBLE = '\u201C'   # "
+RIGHT_DOUBLE = '\u201D'  # "
+RIGHT_SINGLE = '\u2019'  # ' (used for apostrophes)
+
+# Compiled once at import; these run on every prose span. Every apostrophe
+# rule turns ' into the same character, so the rules only differ in context,
+# which lives entirely in lookarounds; a match is always the lone apostrophe
+# and the substitution is a constant string.
+_DQUOTE_RE = re.compile(r'"([^"\n]*)"')
+_DQUOTE_REPL = LEFT_DOUBLE + r'\1' + RIGHT_DOUBLE
+_APOS_RE = re.compile(r"""
+    '(?:
+        # Contractions and possessives: don't, isn't, it's, James's
+        (?<=\w')(?=\w)
+        # Apostrophe at start of word: 'twas, 'tis, 'em, and the first
+        # apostrophe of 'n' style contractions: rock 'n' roll
+      | (?<!\S')(?=\w)
+        # The closing apostrophe of 'n'
+      | (?<=(?<!\S)'\w')(?!\S)
+    )
+""", re.VERBOSE)
+
 
 def convert_quotes(text: str) -> str:
     """Convert straight quotes to curly quotes, preserving code sections."""
-    lines = text.split('\n')
-    result = []
-    in_code_block = False
-    in_front_matter = False
-    front_matter_count = 0
-
-    for i, line in enumerate(lines):
-        # Track YAML front matter (only at start of file)
-        if i == 0 and line == '---':
-            in_front_matter = True
-            front_matter_count = 1
-            result.append(line)
-            continue
-        elif in_front_matter and line == '---':
-            front_matter_count += 1
-            if front_matter_count == 2:
-                in_front_matter = False
-            result.append(line)
-            continue
-
-        # Track code blocks
-        if line.startswith('```'):
-            in_code_block = not in_code_block
-            result.append(line)
-            continue
-
-        # Skip conversion in code blocks or front matter
-        if in_code_block or in_front_matter:
-            result.append(line)
-            continue
-
-        # Convert prose line, preserving inline code
-        result.append(convert_prose_line(line))
-
-    return '\n'.join(result)
-
-
-def convert_prose_line(line: str) -> str:
-    """Convert quotes in a prose line, preserving inline code."""
-    # Split by inline code sections
-    parts = re.split(r'(`[^`]+`)', line)
-
-    converted_parts = []
-    for part in parts:
-        if part.startswith('`') and part.endswith('`'):
-            # Inline code - preserve as-is
-            converted_parts.append(part)
-        else:
-            # Prose - convert quotes
-            converted_parts.append(convert_quotes_in_text(part))
-
-    return ''.join(converted_parts)
+    return quotes_common.split_and_convert(text, convert_quotes_in_text)
 
 
-def convert_quotes_in_text(text: str) -> str:
-    """Convert straight quotes to curly in plain text."""
-    # Unicode characters
-    LEFT_DOUBLE = '\u201C'   # "
-    RIGHT_DOUBLE = '\u201D'  # "
-    RIGHT_SINGLE = '\u2019'  # ' (used for apostrophes)
+def needs_conversion(text: str) -> bool:
+    """Check whether convert_quotes would change text, without converting it."""
+    return quotes_common.needs_conversion(text, convert_quotes_in_text)
 
-    # Convert double quotes: "text" -> "text"
-    text = re.sub(r'"([^"]*)"', LEFT_DOUBLE + r'\1' + RIGHT_DOUBLE, text)
 
-    # Convert apostrophes in contractions: don't, isn't, it's, etc.
-    text = re.sub(r"(\w)'(\w)", r'\1' + RIGHT_SINGLE + r'\2', text)
+def convert_quotes_in_text(text: str) -> str:
+    """Convert straight quotes to curly in plain text.
 
-    # Convert 'n' style contractions: rock 'n' roll
-    # Must come BEFORE start-of-word pattern to catch both apostrophes
-    text = re.sub(r"(^|\s)'(\w)'(\s|$)", r'\1' + RIGHT_SINGLE + r'\2' + RIGHT_SINGLE + r'\3', text)
+    Every rule is decided inside the two compiled patterns, and the
+    apostrophe substitution is a constant string, so no Python code runs
+    per apostrophe.
+    """
+    # Most prose has no straight quotes at all
+    if '"' not in text and "'" not in text:
+        return text
 
-    # Convert apostrophe at start of word: 'twas, 'tis, 'em
-    text = re.sub(r"(^|\s)'(\w)", r'\1' + RIGHT_SINGLE + r'\2', text)
+    # Convert double quotes: "text" -> "text". They pair up within a line; a
+    # quote without a partner stays straight.
+    if '"' in text:
+        text = _DQUOTE_RE.sub(_DQUOTE_REPL, text)
 
-    return text
+    return _APOS_RE.sub(RIGHT_SINGLE, text)
 
 
 def main():
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
-
-    # Parse arguments
-    check_mode = '--check' in sys.argv
-    inplace = '--inplace' in sys.argv
-
-    # Get file path (skip flags)
-    file_args = [a for a in sys.argv[1:] if not a.startswith('--')]
-    if not file_args:
-        print("Error: No file specified", file=sys.stderr)
-        sys.exit(1)
-
-    filepath = file_args[0]
-
-    # Handle stdin explicitly
-    if filepath == '-' or filepath == '/dev/stdin':
-        original = sys.stdin.read()
-        filepath = '<stdin>'
-    else:
-        filepath = Path(filepath)
-        if not filepath.exists():
-            print(f"Error: File not found: {filepath}", file=sys.stderr)
-            sys.exit(1)
-        original = filepath.read_text(encoding='utf-8')
-    converted = convert_quotes(original)
-
-    if check_mode:
-        if original != converted:
-            print(f"{filepath}: needs conversion")
-            sys.exit(1)
-        else:
-            print(f"{filepath}: ok")
-            sys.exit(0)
-    elif inplace:
-        if isinstance(filepath, str):
-            print("Error: Cannot use --inplace with stdin", file=sys.stderr)
-            sys.exit(1)
-        filepath.write_text(converted, encoding='utf-8')
-        print(f"Converted: {filepath}")
-    else:
-        print(converted)
+    # No trigger bytes: nearly every post has a straight quote somewhere, so
+    # checking for them would never skip a file
+    quotes_common.run(__doc__, convert_quotes_in_text, ())
 
 
 if __name__ == '__main__':
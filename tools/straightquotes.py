@@ -11,68 +11,46 @@ Usage:
     straightquotes <file>           # Print converted output to stdout
     straightquotes <file> --inplace # Modify file in place
     straightquotes --check <file>   # Check if file needs conversion (exit 1 if yes)
+
+Needs quotes_common.py from the same directory; copy or symlink both files
+together. A symlinked script still finds it next to the real file.
 """
 
 import sys
-import re
 from pathlib import Path
 
+# Resolve the shared module next to this file, wherever the script is
+# imported or run from
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import quotes_common
+
+# UTF-8 encodings of the four curly quotes. Matching the lead byte 0xE2 alone
+# is useless: em dashes, arrows and the like share it, and every post has some.
+CURLY_QUOTE_BYTES = (b'\xe2\x80\x98', b'\xe2\x80\x99', b'\xe2\x80\x9c', b'\xe2\x80\x9d')
+
 
 def convert_quotes(text: str) -> str:
     """Convert curly quotes to straight quotes, preserving code sections."""
-    lines = text.split('\n')
-    result = []
-    in_code_block = False
-    in_front_matter = False
-    front_matter_count = 0
-
-    for i, line in enumerate(lines):
-        # Track YAML front matter (only at start of file)
-        if i == 0 and line == '---':
-            in_front_matter = True
-            front_matter_count = 1
-            result.append(line)
-            continue
-        elif in_front_matter and line == '---':
-            front_matter_count += 1
-            if front_matter_count == 2:
-                in_front_matter = False
-            result.append(line)
-            continue
-
-        # Track code blocks
-        if line.startswith('```'):
-            in_code_block = not in_code_block
-            result.append(line)
-            continue
-
-        # Skip conversion in code blocks or front matter
-        if in_code_block or in_front_matter:
-            result.append(line)
-            continue
-
-        # Convert prose line, preserving inline code
-        result.append(convert_prose_line(line))
-
-    return '\n'.join(result)
-
-
-def convert_prose_line(line: str) -> str:
-    """Convert curly quotes in a prose line, preserving inline code."""
-    parts = re.split(r'(`[^`]+`)', line)
-
-    converted_parts = []
-    for part in parts:
-        if part.startswith('`') and part.endswith('`'):
-            converted_parts.append(part)
-        else:
-            converted_parts.append(straighten_quotes(part))
-
-    return ''.join(converted_parts)
+    if text.isascii():
+        return text
+    return quotes_common.split_and_convert(text, straighten_quotes)
+
+
+def needs_conversion(text: str) -> bool:
+    """Check whether convert_quotes would change text, without converting it."""
+    return quotes_common.needs_conversion(text, straighten_quotes)
 
 
 def straighten_quotes(text: str) -> str:
     """Replace all curly quotes with straight equivalents."""
+    # Curly quotes are non-ASCII, and isascii() only reads a flag on the
+    # string object, so plain ASCII text skips the replacements entirely
+    if text.isascii():
+        return text
+
+    # str.replace returns the input unchanged when there is no match, and
+    # beats str.translate here: translate only has a fast path for
+    # ASCII-to-ASCII tables and falls back to a per-character dict lookup.
     text = text.replace('\u201c', '"')   # left double
     text = text.replace('\u201d', '"')   # right double
     text = text.replace('\u2018', "'")   # left single
@@ -81,47 +59,7 @@ def straighten_quotes(text: str) -> str:
 
 
 def main():
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
-
-    check_mode = '--check' in sys.argv
-    inplace = '--inplace' in sys.argv
-
-    file_args = [a for a in sys.argv[1:] if not a.startswith('--')]
-    if not file_args:
-        print("Error: No file specified", file=sys.stderr)
-        sys.exit(1)
-
-    filepath = file_args[0]
-
-    if filepath == '-' or filepath == '/dev/stdin':
-        original = sys.stdin.read()
-        filepath = '<stdin>'
-    else:
-        filepath = Path(filepath)
-        if not filepath.exists():
-            print(f"Error: File not found: {filepath}", file=sys.stderr)
-            sys.exit(1)
-        original = filepath.read_text(encoding='utf-8')
-
-    converted = convert_quotes(original)
-
-    if check_mode:
-        if original != converted:
-            print(f"{filepath}: needs conversion")
-            sys.exit(1)
-        else:
-            print(f"{filepath}: ok")
-            sys.exit(0)
-    elif inplace:
-        if isinstance(filepath, str):
-            print("Error: Cannot use --inplace with stdin", file=sys.stderr)
-            sys.exit(1)
-        filepath.write_text(converted, encoding='utf-8')
-        print(f"Converted: {filepath}")
-    else:
-        print(converted)
+    quotes_common.run(__doc__, straighten_quotes, CURLY_QUOTE_BYTES)
 
 
 if __name__ == '__main__':
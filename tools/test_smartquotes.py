@@ -10,7 +10,7 @@ from pathlib import Path
 
 # Import from smartquotes module
 sys.path.insert(0, str(Path(__file__).parent))
-from smartquotes import convert_quotes
+from smartquotes import convert_quotes, needs_conversion
 
 # Unicode constants for readability
 LDQ = '\u201c'  # " left double quote
@@ -49,6 +49,10 @@ class TestCurlyQuotesInProse(unittest.TestCase):
         result = convert_quotes("rock 'n' roll")
         self.assertEqual(result, f"rock {RSQ}n{RSQ} roll")
 
+    def test_chained_contractions(self):
+        result = convert_quotes("rock'n'roll")
+        self.assertEqual(result, f"rock{RSQ}n{RSQ}roll")
+
     def test_mixed_quotes_and_apostrophes(self):
         result = convert_quotes('"Don\'t stop," she said.')
         self.assertEqual(result, f'{LDQ}Don{RSQ}t stop,{RDQ} she said.')
@@ -135,10 +139,34 @@ class TestEdgeCases(unittest.TestCase):
         result = convert_quotes(text)
         self.assertIn('"in code"', result)
 
+    def test_code_block_right_after_front_matter(self):
+        text = '---\ntitle: "Test"\n---\n```\n"code"\n```\nHe said "hi"'
+        result = convert_quotes(text)
+        self.assertIn('title: "Test"', result)
+        self.assertIn('\n"code"\n', result)
+        self.assertIn(f'He said {LDQ}hi{RDQ}', result)
+
+    def test_fence_inside_front_matter_is_not_code(self):
+        # A ``` line in front matter must not swallow the prose after it
+        text = '---\nx: ```\n```\n---\nHe said "hi"'
+        self.assertEqual(convert_quotes(text), f'---\nx: ```\n```\n---\nHe said {LDQ}hi{RDQ}')
+
+    def test_consecutive_code_blocks(self):
+        text = '```\n"a"\n```\n```js\n"b"\n```\n"c"'
+        self.assertEqual(convert_quotes(text), f'```\n"a"\n```\n```js\n"b"\n```\n{LDQ}c{RDQ}')
+
     def test_nested_backticks_in_code_block(self):
         text = '```\nconst s = `template "literal"`;\n```'
         self.assertEqual(convert_quotes(text), text)
 
+    def test_empty_backticks_are_not_code(self):
+        result = convert_quotes("Empty `` don't")
+        self.assertEqual(result, f"Empty `` don{RSQ}t")
+
+    def test_double_quotes_do_not_pair_across_lines(self):
+        result = convert_quotes('He said "hi\nand "bye"')
+        self.assertEqual(result, f'He said "hi\nand {LDQ}bye{RDQ}')
+
     def test_empty_quotes(self):
         self.assertEqual(convert_quotes('""'), f'{LDQ}{RDQ}')
 
@@ -147,6 +175,26 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(result, f"James{RSQ}s book")
 
 
+class TestNeedsConversion(unittest.TestCase):
+    """needs_conversion should agree with convert_quotes."""
+
+    def test_straight_quotes_in_prose(self):
+        self.assertTrue(needs_conversion('Intro\n\nHe said "hello"'))
+
+    def test_contraction_in_prose(self):
+        self.assertTrue(needs_conversion("don't"))
+
+    def test_already_curly(self):
+        self.assertFalse(needs_conversion(f'Already {LDQ}curly{RDQ} and don{RSQ}t'))
+
+    def test_quotes_only_in_code(self):
+        text = '---\ntitle: "Test"\n---\n\nUse `"raw"`\n\n```\nx = "a"\n```'
+        self.assertFalse(needs_conversion(text))
+
+    def test_unpaired_double_quote(self):
+        self.assertFalse(needs_conversion('A lone " stays straight'))
+
+
 class TestStdinHandling(unittest.TestCase):
     """Test stdin input modes (requires running script as subprocess)."""
 
@@ -192,5 +240,72 @@ class TestStdinHandling(unittest.TestCase):
         self.assertIn("Cannot use --inplace with stdin", result.stderr)
 
 
+class TestFileHandling(unittest.TestCase):
+    """Test reading and writing files (requires running script as subprocess)."""
+
+    def setUp(self):
+        import tempfile
+        self.script = Path(__file__).parent / "smartquotes.py"
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "post.md"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_script(self, args):
+        """Run the smartquotes script with given args."""
+        import subprocess
+        result = subprocess.run(
+            ["python3", str(self.script)] + args,
+            capture_output=True,
+            text=True,
+            timeout=5  # Prevent hangs
+        )
+        return result
+
+    def test_inplace_converts_file(self):
+        self.path.write_bytes('He said "hello"\n'.encode('utf-8'))
+        result = self.run_script([str(self.path), "--inplace"])
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(self.path.read_bytes().decode('utf-8'), f'He said {LDQ}hello{RDQ}\n')
+
+    def test_check_mode_file_ok(self):
+        self.path.write_bytes(f'curly {LDQ}quotes{RDQ}\n'.encode('utf-8'))
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("ok", result.stdout)
+
+    def test_check_mode_file_needs_conversion(self):
+        self.path.write_bytes(b'straight "quotes"\n')
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("needs conversion", result.stdout)
+
+    def test_check_mode_empty_file(self):
+        self.path.write_bytes(b'')
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("ok", result.stdout)
+
+    def test_check_mode_non_utf8_file_fails(self):
+        # Windows-1252 curly quotes, with nothing for the tool to convert
+        self.path.write_bytes(b'He said \x93hi\x94\n')
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Not valid UTF-8", result.stderr)
+
+    def test_crlf_front_matter_preserved(self):
+        self.path.write_bytes(b'---\r\ntitle: "Test"\r\n---\r\nHe said "hi"\r\n')
+        result = self.run_script([str(self.path)])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn('title: "Test"', result.stdout)
+        self.assertIn(f'He said {LDQ}hi{RDQ}', result.stdout)
+
+    def test_missing_file(self):
+        result = self.run_script([str(self.path)])
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("File not found", result.stderr)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,183 @@
+"""Tests for straightquotes script.
+
+Run with: python3 test_straightquotes.py
+Or with pytest if installed: pytest test_straightquotes.py -v
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Import from straightquotes module
+sys.path.insert(0, str(Path(__file__).parent))
+from straightquotes import convert_quotes, needs_conversion
+
+# Unicode constants for readability
+LDQ = '\u201c'  # " left double quote
+RDQ = '\u201d'  # " right double quote
+LSQ = '\u2018'  # ' left single quote
+RSQ = '\u2019'  # ' right single quote (apostrophe)
+
+
+class TestStraightQuotesInProse(unittest.TestCase):
+    """Curly quotes should become straight in prose."""
+
+    def test_double_quotes(self):
+        result = convert_quotes(f'He said {LDQ}hello{RDQ}')
+        self.assertEqual(result, 'He said "hello"')
+
+    def test_single_quotes(self):
+        result = convert_quotes(f'{LSQ}quoted{RSQ}')
+        self.assertEqual(result, "'quoted'")
+
+    def test_apostrophe_contraction(self):
+        result = convert_quotes(f"don{RSQ}t")
+        self.assertEqual(result, "don't")
+
+    def test_prose_across_lines(self):
+        text = f'{LDQ}One{RDQ} line\nand don{RSQ}t\n\n{LSQ}another{RSQ} paragraph\n'
+        result = convert_quotes(text)
+        self.assertEqual(result, '"One" line\nand don\'t\n\n\'another\' paragraph\n')
+
+    def test_other_non_ascii_kept(self):
+        result = convert_quotes(f'Café — {LDQ}olé{RDQ}')
+        self.assertEqual(result, 'Café — "olé"')
+
+
+class TestCurlyQuotesInCode(unittest.TestCase):
+    """Curly quotes should be preserved in code."""
+
+    def test_code_block_preserved(self):
+        text = f'```\nconst x = {LDQ}hello{RDQ};\n```'
+        self.assertEqual(convert_quotes(text), text)
+
+    def test_code_block_with_language(self):
+        text = f'```python\nprint({LSQ}don{RSQ}t{RSQ})\n```'
+        self.assertEqual(convert_quotes(text), text)
+
+    def test_inline_code_preserved(self):
+        text = f'Use `{LDQ}quotes{RDQ}` here'
+        self.assertEqual(convert_quotes(text), text)
+
+    def test_inline_code_across_lines_is_not_code(self):
+        # Inline code never spans lines, so these backticks delimit nothing
+        result = convert_quotes(f'a `b {RSQ}c{RSQ}\nd` e')
+        self.assertEqual(result, "a `b 'c'\nd` e")
+
+
+class TestYAMLFrontMatter(unittest.TestCase):
+    """YAML front matter should be preserved."""
+
+    def test_front_matter_preserved(self):
+        text = f'---\ntitle: {LDQ}Test{RDQ}\n---\n\nHe said {LDQ}hi{RDQ}'
+        result = convert_quotes(text)
+        self.assertEqual(result, f'---\ntitle: {LDQ}Test{RDQ}\n---\n\nHe said "hi"')
+
+    def test_front_matter_then_code_block(self):
+        text = f'---\ntitle: {LDQ}Test{RDQ}\n---\n```\n{LDQ}code{RDQ}\n```\n{LDQ}prose{RDQ}'
+        result = convert_quotes(text)
+        self.assertEqual(result, f'---\ntitle: {LDQ}Test{RDQ}\n---\n```\n{LDQ}code{RDQ}\n```\n"prose"')
+
+
+class TestEdgeCases(unittest.TestCase):
+    """Edge cases and boundary conditions."""
+
+    def test_empty_string(self):
+        self.assertEqual(convert_quotes(''), '')
+
+    def test_already_straight(self):
+        text = 'Already "straight" and don\'t'
+        self.assertEqual(convert_quotes(text), text)
+
+    def test_fence_inside_front_matter_is_not_code(self):
+        # A ``` line in front matter must not swallow the prose after it
+        text = f'---\nx: ```\n```\n---\nHe said {LDQ}hi{RDQ}'
+        self.assertEqual(convert_quotes(text), '---\nx: ```\n```\n---\nHe said "hi"')
+
+    def test_unclosed_code_block(self):
+        text = f'Before {LDQ}a{RDQ}\n```\n{LDQ}in code{RDQ}\nno closing'
+        self.assertEqual(convert_quotes(text), f'Before "a"\n```\n{LDQ}in code{RDQ}\nno closing')
+
+
+class TestNeedsConversion(unittest.TestCase):
+    """needs_conversion should agree with convert_quotes."""
+
+    def test_agrees_with_convert_quotes(self):
+        texts = [
+            '',
+            'Plain "ASCII" text',
+            f'He said {LDQ}hi{RDQ}',
+            f'Curly only in `{RSQ}code{RSQ}`',
+            f'---\ntitle: {LDQ}Test{RDQ}\n---\n```\n{LDQ}a{RDQ}\n```\nplain',
+            f'a `b {RSQ}c{RSQ}\nd` e',
+            'Café without quotes',
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(needs_conversion(text), convert_quotes(text) != text)
+
+
+class TestFileHandling(unittest.TestCase):
+    """Test reading and writing files (requires running script as subprocess)."""
+
+    def setUp(self):
+        import tempfile
+        self.script = Path(__file__).parent / "straightquotes.py"
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "post.md"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_script(self, args):
+        """Run the straightquotes script with given args."""
+        import subprocess
+        result = subprocess.run(
+            ["python3", str(self.script)] + args,
+            capture_output=True,
+            text=True,
+            timeout=5  # Prevent hangs
+        )
+        return result
+
+    def test_inplace_converts_file(self):
+        self.path.write_bytes(f'He said {LDQ}hello{RDQ}\n'.encode('utf-8'))
+        result = self.run_script([str(self.path), "--inplace"])
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(self.path.read_bytes(), b'He said "hello"\n')
+
+    def test_check_mode_ascii_file_ok(self):
+        self.path.write_bytes(b'straight "quotes" and don\'t\n')
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("ok", result.stdout)
+
+    def test_check_mode_file_needs_conversion(self):
+        self.path.write_bytes(f'curly {LDQ}quotes{RDQ}\n'.encode('utf-8'))
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("needs conversion", result.stdout)
+
+    def test_check_mode_empty_file(self):
+        self.path.write_bytes(b'')
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("ok", result.stdout)
+
+    def test_check_mode_em_dash_file_ok(self):
+        # An em dash shares the 0xE2 lead byte with the curly quotes
+        self.path.write_bytes(b'a \xe2\x80\x94 b\n')
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("ok", result.stdout)
+
+    def test_check_mode_non_utf8_file_fails(self):
+        # Windows-1252 curly quotes, which have no 0xE2 byte
+        self.path.write_bytes(b'He said \x93hi\x94\n')
+        result = self.run_script(["--check", str(self.path)])
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Not valid UTF-8", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()